@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 from typing import List, Optional
 from datetime import datetime
 
-@dataclass
+@dataclass(slots=True)
 class ConversationNode:
     """
     Represents a single node in the conversation tree.
@@ -14,6 +14,23 @@ class ConversationNode:
     timestamp: datetime = field(default_factory=datetime.now)
     children: List['ConversationNode'] = field(default_factory=list)
     parent: Optional['ConversationNode'] = None
+    is_fork: bool = False
+    in_fork: bool = field(default=False, init=False)
+
+    def __post_init__(self) -> None:
+        self.in_fork = self.is_fork
+
+    def _refresh_in_fork(self) -> None:
+        """
+        Recomputes the in_fork flag for this node and its entire subtree.
+
+        A node is in a fork if it is a fork node or its parent is in a fork.
+        """
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            node.in_fork = node.is_fork or (node.parent is not None and node.parent.in_fork)
+            stack.extend(node.children)
 
     def add_child(self, child: 'ConversationNode') -> None:
         """
@@ -24,6 +41,7 @@ class ConversationNode:
         """
         self.children.append(child)
         child.parent = self
+        child._refresh_in_fork()
 
     def remove_child(self, child: 'ConversationNode') -> None:
         """
@@ -35,6 +53,7 @@ class ConversationNode:
         if child in self.children:
             self.children.remove(child)
             child.parent = None
+            child._refresh_in_fork()
 
     def is_leaf(self) -> bool:
         """
@@ -61,9 +80,12 @@ class ConversationNode:
         Returns:
             int: The depth of the node (0 for root, 1 for root's children, etc.)
         """
-        if self.is_root():
-            return 0
-        return 1 + self.parent.depth()
+        depth = 0
+        node = self.parent
+        while node is not None:
+            depth += 1
+            node = node.parent
+        return depth
 
     def __str__(self) -> str:
         """
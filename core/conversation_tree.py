@@ -1,4 +1,4 @@
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional
 from .conversation_node import ConversationNode
 from .api_client import ClaudeClient
 
@@ -12,6 +12,8 @@ class ConversationTree:
         self.root = ConversationNode(content="Root", role="system")
         self.current_node = self.root
         self.claude_client = ClaudeClient()
+        self._ascii_cache: Optional[str] = None
+        self._history_cache: Optional[List[Dict[str, str]]] = None
 
     def add_message(self, content: str, role: str) -> None:
         """
@@ -24,6 +26,15 @@ class ConversationTree:
         new_node = ConversationNode(content=content, role=role)
         self.current_node.add_child(new_node)
         self.current_node = new_node
+        self._invalidate_caches()
+
+    def _invalidate_caches(self) -> None:
+        """
+        Drops cached views of the tree. Must be called after any change to the
+        tree structure or to current_node.
+        """
+        self._ascii_cache = None
+        self._history_cache = None
 
     def fork(self) -> None:
         """
@@ -32,9 +43,10 @@ class ConversationTree:
         Args:
             branch_name (str): The name of the new branch.
         """
-        fork_node = ConversationNode(content="<FORK>", role="system")
+        fork_node = ConversationNode(content="<FORK>", role="system", is_fork=True)
         self.current_node.add_child(fork_node)
         self.current_node = fork_node
+        self._invalidate_caches()
 
     def merge(self, merge_prompt: str) -> None:
         """
@@ -42,9 +54,9 @@ class ConversationTree:
         """
         # Find the fork node
         fork_node = self.current_node
-        while fork_node.content != "<FORK>" and fork_node.parent:
+        while not fork_node.is_fork and fork_node.parent:
             fork_node = fork_node.parent
-        if fork_node.content != "<FORK>":
+        if not fork_node.is_fork:
             raise ValueError("No fork found to merge")
         
         # Summarize the forked conversation
@@ -65,6 +77,7 @@ class ConversationTree:
 
         # Remove the fork and its entire subtree
         parent_of_fork.remove_child(fork_node)
+        self._invalidate_caches()
 
     def _summarize_fork(self, fork_node: ConversationNode, merge_prompt: str) -> str:
         """
@@ -88,6 +101,22 @@ class ConversationTree:
             print(f"Error while summarizing fork: {e}")
             return "Unable to summarize the forked conversation due to an error."
 
+    def _iter_messages(self, node: ConversationNode) -> Iterator[str]:
+        """
+        Lazily yields the messages in a branch, following the first child at each step.
+
+        Args:
+            node (ConversationNode): The node to start collecting from.
+
+        Yields:
+            str: A message string of the form "role: content".
+        """
+        current = node
+        while current.children:
+            current = current.children[0]
+            if current.role != "system":
+                yield f"{current.role}: {current.content}"
+
     def _collect_messages(self, node: ConversationNode) -> List[str]:
         """
         Collects all messages in a branch.
@@ -98,14 +127,7 @@ class ConversationTree:
         Returns:
             List[str]: A list of message strings.
         """
-        messages = []
-        current = node
-        while current and current.children:
-            child = current.children[0]
-            if child.role != "system":
-                messages.append(f"{child.role}: {child.content}")
-            current = child
-        return messages
+        return list(self._iter_messages(node))
 
     def chat_with_claude(self, message: str) -> str:
         """
@@ -125,24 +147,27 @@ class ConversationTree:
 
     def get_conversation_history(self) -> List[Dict[str, str]]:
         """
-        Retrieves the conversation history, excluding system messages.
+        Retrieves the conversation history leading to the current node, excluding system messages.
 
         Returns:
             List[Dict[str, str]]: A list of dictionaries representing the conversation history.
         """
+        if self._history_cache is not None:
+            return [dict(message) for message in self._history_cache]
+
         history = []
-        
-        def traverse_tree(node):
+        node = self.current_node
+        while node:
             if node.role in ["user", "assistant"]:
                 history.append({"role": node.role, "content": node.content})
             elif node.role == "system" and node.content.startswith("MERGE SUMMARY:"):
                 # Include merge summaries as user messages
                 history.append({"role": "user", "content": node.content})
-            for child in node.children:
-                traverse_tree(child)
+            node = node.parent
 
-        traverse_tree(self.root)
-        return history
+        history.reverse()
+        self._history_cache = history
+        return [dict(message) for message in history]
 
     def print_tree(self, node: Optional[ConversationNode] = None, level: int = 0) -> None:
         """
@@ -155,9 +180,11 @@ class ConversationTree:
         if node is None:
             node = self.root
 
-        print("  " * level + str(node))
-        for child in node.children:
-            self.print_tree(child, level + 1)
+        stack = [(node, level)]
+        while stack:
+            node, level = stack.pop()
+            print("  " * level + str(node))
+            stack.extend((child, level + 1) for child in reversed(node.children))
 
     def get_flat_conversation(self) -> List[str]:
         messages = []
@@ -171,31 +198,39 @@ class ConversationTree:
         return messages
 
     def is_in_fork(self) -> bool:
-        current = self.current_node
-        while current.parent:
-            if current.content == "<FORK>":
-                return True
-            current = current.parent
-        return False
+        return self.current_node.in_fork
     
     def generate_ascii_tree(self) -> str:
         """
         Generates an ASCII representation of the conversation tree.
 
+        The rendered string is cached until the tree is next mutated.
+
         Returns:
             str: ASCII tree representing the conversation structure.
         """
-        def tree_lines(node, prefix="", is_last=True):
-            lines = []
-            content = (node.content[:30] + '...') if len(node.content) > 30 else node.content
-            lines.append(f"{prefix}{'└── ' if is_last else '├── '}[{node.role}] {content}")
-            
-            prefix += "    " if is_last else "│   "
-            child_count = len(node.children)
-            
-            for i, child in enumerate(node.children):
-                lines.extend(tree_lines(child, prefix, i == child_count - 1))
-            
-            return lines
-
-        return "\n".join(tree_lines(self.root))
\ No newline at end of file
+        if self._ascii_cache is not None:
+            return self._ascii_cache
+
+        lines = []
+        stack = [(self.root, "", True)]
+        while stack:
+            node, prefix, is_last = stack.pop()
+            content = node.content
+            if len(content) > 30:
+                content = f"{content[:30]}..."
+            if is_last:
+                lines.append(f"{prefix}└── [{node.role}] {content}")
+                prefix += "    "
+            else:
+                lines.append(f"{prefix}├── [{node.role}] {content}")
+                prefix += "│   "
+
+            last_index = len(node.children) - 1
+
+            # Push in reverse so children are emitted in their original order
+            for i in range(last_index, -1, -1):
+                stack.append((node.children[i], prefix, i == last_index))
+
+        self._ascii_cache = "\n".join(lines)
+        return self._ascii_cache
\ No newline at end of file
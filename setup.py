@@ -4,6 +4,7 @@ setup(
     name='forky',
     version='0.1',
     packages=find_packages(),
+    python_requires='>=3.10',
     install_requires=[line.strip() for line in open('requirements.txt')],
     entry_points={
         'console_scripts': [